@@ -10,12 +10,25 @@ This implements what WORKED in the original analysis:
 - Calculation that matched billing within $0.60
 
 Usage: ./calculate_costs.py <metrics.json> <days_in_month>
+       ./calculate_costs.py --batch [--verbose] <metrics.json|glob>... --days <days_in_month>
+
+Batch mode pays interpreter startup once and emits a single JSON array
+with one cost breakdown per file. Its pricing_notes are left empty unless
+--verbose is given. Files for services without a cost calculation (e.g.
+storage, cloudrun) are reported as {"file": ..., "error": ...} entries.
 """
 
+import argparse
 import json
 import sys
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, List
+
+from json_io import dump_json, expand_paths, load_files, load_json
+
+# Byte -> GiB/TiB conversion factors (exact, since both are powers of two)
+_INV_GIB = 1.0 / (1024**3)
+_INV_TIB = 1.0 / (1024**4)
 
 
 @dataclass
@@ -30,7 +43,7 @@ class CostBreakdown:
     pricing_notes: list
 
 
-def calculate_firestore_costs(metrics: Dict, days: int) -> CostBreakdown:
+def calculate_firestore_costs(metrics: Dict, days: int, verbose: bool = False) -> CostBreakdown:
     """
     Calculate Firestore costs with free tier.
 
@@ -50,7 +63,7 @@ def calculate_firestore_costs(metrics: Dict, days: int) -> CostBreakdown:
     writes = metrics.get("firestore.googleapis.com/document/write_count", 0)
     deletes = metrics.get("firestore.googleapis.com/document/delete_count", 0)
     storage_bytes = metrics.get("firestore.googleapis.com/storage/total_bytes", 0)
-    storage_gib = storage_bytes / (1024**3)
+    storage_gib = storage_bytes * _INV_GIB
 
     # Free tiers
     free_reads = 50_000 * days
@@ -80,6 +93,15 @@ def calculate_firestore_costs(metrics: Dict, days: int) -> CostBreakdown:
         + min(storage_gib, free_storage_gib) * 0.18
     )
 
+    pricing_notes = []
+    if verbose:
+        pricing_notes = [
+            f"Total reads: {reads:,} ({billable_reads:,} billable after {free_reads:,} free)",
+            f"Total writes: {writes:,} ({billable_writes:,} billable after {free_writes:,} free)",
+            f"Total deletes: {deletes:,} ({billable_deletes:,} billable after {free_deletes:,} free)",
+            f"Storage: {storage_gib:.2f} GiB ({billable_storage:.2f} GiB billable after {free_storage_gib} GiB free)",
+        ]
+
     return CostBreakdown(
         service="firestore",
         total_cost=round(total, 2),
@@ -96,16 +118,11 @@ def calculate_firestore_costs(metrics: Dict, days: int) -> CostBreakdown:
             "deletes": int(billable_deletes),
             "storage_gib": round(billable_storage, 2),
         },
-        pricing_notes=[
-            f"Total reads: {reads:,} ({billable_reads:,} billable after {free_reads:,} free)",
-            f"Total writes: {writes:,} ({billable_writes:,} billable after {free_writes:,} free)",
-            f"Total deletes: {deletes:,} ({billable_deletes:,} billable after {free_deletes:,} free)",
-            f"Storage: {storage_gib:.2f} GiB ({billable_storage:.2f} GiB billable after {free_storage_gib} GiB free)",
-        ],
+        pricing_notes=pricing_notes,
     )
 
 
-def calculate_rtdb_costs(metrics: Dict, days: int) -> CostBreakdown:
+def calculate_rtdb_costs(metrics: Dict, days: int, verbose: bool = False) -> CostBreakdown:
     """
     Calculate Firebase Realtime Database costs.
 
@@ -121,8 +138,8 @@ def calculate_rtdb_costs(metrics: Dict, days: int) -> CostBreakdown:
     bandwidth_bytes = metrics.get("firebasedatabase.googleapis.com/network/monthly_sent", 0)
     api_hits = metrics.get("firebasedatabase.googleapis.com/network/api_hits_count", 0)
 
-    storage_gb = storage_bytes / (1024**3)
-    bandwidth_gb = bandwidth_bytes / (1024**3)
+    storage_gb = storage_bytes * _INV_GIB
+    bandwidth_gb = bandwidth_bytes * _INV_GIB
 
     # Free tiers (assuming Blaze plan)
     free_storage_gb = 1.0
@@ -143,6 +160,14 @@ def calculate_rtdb_costs(metrics: Dict, days: int) -> CostBreakdown:
         bandwidth_gb, free_bandwidth_gb
     ) * 1.00
 
+    pricing_notes = []
+    if verbose:
+        pricing_notes = [
+            f"Storage: {storage_gb:.2f} GB ({billable_storage:.2f} GB billable after {free_storage_gb} GB free)",
+            f"Bandwidth: {bandwidth_gb:.2f} GB ({billable_bandwidth:.2f} GB billable after {free_bandwidth_gb} GB free)",
+            f"API hits: {api_hits:,} (included in bandwidth cost)",
+        ]
+
     return CostBreakdown(
         service="rtdb",
         total_cost=round(total, 2),
@@ -156,15 +181,11 @@ def calculate_rtdb_costs(metrics: Dict, days: int) -> CostBreakdown:
             "bandwidth_gb": round(billable_bandwidth, 2),
             "api_hits": int(api_hits),
         },
-        pricing_notes=[
-            f"Storage: {storage_gb:.2f} GB ({billable_storage:.2f} GB billable after {free_storage_gb} GB free)",
-            f"Bandwidth: {bandwidth_gb:.2f} GB ({billable_bandwidth:.2f} GB billable after {free_bandwidth_gb} GB free)",
-            f"API hits: {api_hits:,} (included in bandwidth cost)",
-        ],
+        pricing_notes=pricing_notes,
     )
 
 
-def calculate_functions_costs(metrics: Dict, days: int) -> CostBreakdown:
+def calculate_functions_costs(metrics: Dict, days: int, verbose: bool = False) -> CostBreakdown:
     """
     Calculate Cloud Functions costs (approximate).
 
@@ -180,6 +201,18 @@ def calculate_functions_costs(metrics: Dict, days: int) -> CostBreakdown:
     # Note: This doesn't include compute time, which varies by function
     # configuration. Would need more detailed metrics.
 
+    pricing_notes = []
+    if verbose:
+        pricing_notes = [
+            f"Executions: {executions:,}",
+            "WARNING: This is approximate. Actual costs depend on:",
+            "  - Memory allocation",
+            "  - CPU time",
+            "  - Network egress",
+            "  - Always-on instances (minInstances > 0)",
+            "Check Cloud Functions billing for exact breakdown.",
+        ]
+
     return CostBreakdown(
         service="functions",
         total_cost=round(invocation_cost, 2),
@@ -190,26 +223,18 @@ def calculate_functions_costs(metrics: Dict, days: int) -> CostBreakdown:
         billable_usage={
             "executions": int(executions),
         },
-        pricing_notes=[
-            f"Executions: {executions:,}",
-            "WARNING: This is approximate. Actual costs depend on:",
-            "  - Memory allocation",
-            "  - CPU time",
-            "  - Network egress",
-            "  - Always-on instances (minInstances > 0)",
-            "Check Cloud Functions billing for exact breakdown.",
-        ],
+        pricing_notes=pricing_notes,
     )
 
 
-def calculate_bigquery_costs(metrics: Dict, days: int) -> CostBreakdown:
+def calculate_bigquery_costs(metrics: Dict, days: int, verbose: bool = False) -> CostBreakdown:
     """Calculate BigQuery costs."""
     stored_bytes = metrics.get("bigquery.googleapis.com/storage/stored_bytes", 0)
     query_count = metrics.get("bigquery.googleapis.com/query/count", 0)
     scanned_bytes = metrics.get("bigquery.googleapis.com/query/scanned_bytes", 0)
 
-    stored_tb = stored_bytes / (1024**4)
-    scanned_tb = scanned_bytes / (1024**4)
+    stored_tb = stored_bytes * _INV_TIB
+    scanned_tb = scanned_bytes * _INV_TIB
 
     # Active storage: $0.02 per GB ($20 per TB)
     # Long-term storage (90+ days): $0.01 per GB ($10 per TB)
@@ -221,6 +246,14 @@ def calculate_bigquery_costs(metrics: Dict, days: int) -> CostBreakdown:
 
     total = storage_cost + query_cost
 
+    pricing_notes = []
+    if verbose:
+        pricing_notes = [
+            f"Storage: {stored_tb:.3f} TB",
+            f"Queries: {query_count:,} queries scanning {scanned_tb:.3f} TB",
+            "First 10 GB of queries per month are free",
+        ]
+
     return CostBreakdown(
         service="bigquery",
         total_cost=round(total, 2),
@@ -234,54 +267,127 @@ def calculate_bigquery_costs(metrics: Dict, days: int) -> CostBreakdown:
             "scanned_tb": round(scanned_tb, 3),
             "query_count": int(query_count),
         },
-        pricing_notes=[
-            f"Storage: {stored_tb:.3f} TB",
-            f"Queries: {query_count:,} queries scanning {scanned_tb:.3f} TB",
-            "First 10 GB of queries per month are free",
-        ],
+        pricing_notes=pricing_notes,
     )
 
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: calculate_costs.py <metrics.json> <days_in_month>", file=sys.stderr)
-        sys.exit(1)
+# Service name (and aliases) -> cost calculator
+CALCULATORS = {
+    "firestore": calculate_firestore_costs,
+    "rtdb": calculate_rtdb_costs,
+    "realtime-db": calculate_rtdb_costs,
+    "firebase-db": calculate_rtdb_costs,
+    "functions": calculate_functions_costs,
+    "cloud-functions": calculate_functions_costs,
+    "bigquery": calculate_bigquery_costs,
+}
 
-    metrics_file = sys.argv[1]
-    days = int(sys.argv[2])
 
-    try:
-        with open(metrics_file) as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"ERROR: File not found: {metrics_file}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON: {e}", file=sys.stderr)
-        sys.exit(1)
+def calculate_result(data: Dict, days: int, verbose: bool = False) -> Dict:
+    """
+    Calculate the cost breakdown for one loaded metrics file.
 
+    pricing_notes are only formatted when verbose is set.
+    Raises ValueError for services without a cost calculation.
+    """
     service = data.get("service", "unknown")
     metrics = data.get("metrics", {})
 
     # Calculate costs based on service
-    if service == "firestore":
-        breakdown = calculate_firestore_costs(metrics, days)
-    elif service in ["rtdb", "realtime-db", "firebase-db"]:
-        breakdown = calculate_rtdb_costs(metrics, days)
-    elif service in ["functions", "cloud-functions"]:
-        breakdown = calculate_functions_costs(metrics, days)
-    elif service == "bigquery":
-        breakdown = calculate_bigquery_costs(metrics, days)
+    calculator = CALCULATORS.get(service)
+    if calculator is None:
+        raise ValueError(f"Cost calculation not implemented for service: {service}")
+    breakdown = calculator(metrics, days, verbose)
+
+    return format_result(breakdown, data, days)
+
+
+def format_result(breakdown: CostBreakdown, data: Dict, days: int) -> Dict:
+    """Shape a cost breakdown for JSON output."""
+    # Shallow copy of the fields; asdict() would deep-copy every container
+    return {
+        **vars(breakdown),
+        "calculation_date": data.get("collection_time", "unknown"),
+        "days_in_period": days,
+    }
+
+
+def process_file(path: str, days: int, verbose: bool = False) -> Dict:
+    """Load one metrics file and calculate its cost breakdown."""
+    return calculate_result(load_json(path), days, verbose)
+
+
+def calculate_batch(records: List[Dict], days: int, verbose: bool = False) -> List[Dict]:
+    """
+    Calculate cost breakdowns for many loaded metrics files.
+
+    Files for services without a cost calculation get an {"error": ...}
+    entry instead of aborting the whole batch.
+    """
+    results = []
+    for data in records:
+        try:
+            results.append(calculate_result(data, days, verbose))
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return results
+
+
+def process_batch(paths: List[str], days: int, verbose: bool = False) -> List[Dict]:
+    """Calculate cost breakdowns for many metrics files, tagging each with its file."""
+    results = calculate_batch(load_files(paths), days, verbose)
+    return [{"file": path, **result} for path, result in zip(paths, results)]
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse the single-file or --batch command line; exits with usage on error."""
+    parser = argparse.ArgumentParser(
+        prog="calculate_costs.py",
+        usage=(
+            "%(prog)s <metrics.json> <days_in_month>\n"
+            "       %(prog)s --batch [--verbose] <metrics.json|glob>... --days <days_in_month>"
+        ),
+    )
+    parser.add_argument("inputs", nargs="+", help=argparse.SUPPRESS)
+    parser.add_argument("--batch", action="store_true", help="cost many metrics files in one run")
+    parser.add_argument("--days", type=int, help="days in the period (batch mode)")
+    parser.add_argument("--verbose", action="store_true", help="include pricing_notes in batch output")
+    args = parser.parse_intermixed_args(argv)
+
+    if args.batch:
+        if args.days is None:
+            parser.error("--batch requires --days <days_in_month>")
     else:
-        print(f"ERROR: Cost calculation not implemented for service: {service}", file=sys.stderr)
+        if len(args.inputs) != 2 or args.days is not None:
+            parser.error("expected <metrics.json> <days_in_month>")
+        try:
+            args.days = int(args.inputs[1])
+        except ValueError:
+            parser.error(f"invalid days_in_month: {args.inputs[1]!r}")
+        args.inputs = args.inputs[:1]
+    return args
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+
+    try:
+        if args.batch:
+            result = process_batch(expand_paths(args.inputs), args.days, args.verbose)
+        else:
+            result = process_file(args.inputs[0], args.days, verbose=True)
+    except FileNotFoundError as e:
+        print(f"ERROR: File not found: {e.filename}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Invalid JSON: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Output result
-    result = asdict(breakdown)
-    result["calculation_date"] = data.get("collection_time", "unknown")
-    result["days_in_period"] = days
-
-    print(json.dumps(result, indent=2))
+    dump_json(result)
 
 
 if __name__ == "__main__":
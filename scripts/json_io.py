@@ -0,0 +1,65 @@
+"""
+json_io.py - Shared JSON file I/O for the cost analyzer scripts
+
+Used by calculate_costs.py and validate_data.py (this directory is on
+sys.path when either script runs). orjson is used when installed, with
+the stdlib json module as the fallback.
+"""
+
+import glob
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib parser/serializer
+    orjson = None
+
+
+def load_json(path: str) -> Dict:
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+def dump_json(obj: Any) -> None:
+    """
+    Write obj to stdout as JSON, using orjson when it is installed.
+
+    Output is indented for a terminal and compact when piped or redirected.
+    """
+    pretty = sys.stdout.isatty()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        sys.stdout.buffer.write(orjson.dumps(obj, option=option) + b"\n")
+    elif pretty:
+        print(json.dumps(obj, indent=2))
+    else:
+        print(json.dumps(obj, separators=(",", ":")))
+
+
+def expand_paths(patterns: List[str]) -> List[str]:
+    """Expand glob patterns; plain paths are kept so missing files still error."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        paths.extend(matches if matches else [pattern])
+    return paths
+
+
+def load_files(paths: List[str]) -> List[Dict]:
+    """Load metrics files, overlapping disk I/O across a thread pool."""
+    with ThreadPoolExecutor() as pool:
+        futures = [pool.submit(load_json, path) for path in paths]
+        loaded = []
+        for path, future in zip(paths, futures):
+            try:
+                loaded.append(future.result())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in {path}: {e}") from e
+        return loaded
@@ -8,48 +8,56 @@ This prevents mistake #5 from original analysis:
 Speculating about missing data instead of flagging it clearly.
 
 Usage: ./validate_data.py <metrics_json_file>
+       ./validate_data.py --batch <metrics_json_file|glob>...
+
+Batch mode emits a JSON array of reports and exits 0 only if all pass.
 """
 
 import json
 import sys
 from typing import Dict, List, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
+
+from json_io import dump_json, expand_paths, load_files, load_json
 
-# Expected metrics per service
+# Expected metrics per service (tuples, so reports follow this order)
 SERVICE_METRICS = {
-    "firestore": [
+    "firestore": (
         "firestore.googleapis.com/document/read_count",
         "firestore.googleapis.com/document/write_count",
         "firestore.googleapis.com/document/delete_count",
         "firestore.googleapis.com/storage/total_bytes",
-    ],
-    "rtdb": [
+    ),
+    "rtdb": (
         "firebasedatabase.googleapis.com/network/monthly_sent",
         "firebasedatabase.googleapis.com/storage/total_bytes",
         "firebasedatabase.googleapis.com/network/api_hits_count",
-    ],
-    "functions": [
+    ),
+    "functions": (
         "cloudfunctions.googleapis.com/function/execution_count",
         "cloudfunctions.googleapis.com/function/execution_times",
         "cloudfunctions.googleapis.com/function/active_instances",
-    ],
-    "bigquery": [
+    ),
+    "bigquery": (
         "bigquery.googleapis.com/storage/stored_bytes",
         "bigquery.googleapis.com/query/count",
         "bigquery.googleapis.com/query/scanned_bytes",
-    ],
-    "storage": [
+    ),
+    "storage": (
         "storage.googleapis.com/storage/total_bytes",
         "storage.googleapis.com/network/sent_bytes_count",
         "storage.googleapis.com/api/request_count",
-    ],
-    "cloudrun": [
+    ),
+    "cloudrun": (
         "run.googleapis.com/request_count",
         "run.googleapis.com/container/instance_count",
         "run.googleapis.com/container/billable_instance_time",
-    ],
+    ),
 }
 
+# Sentinel for metrics absent from the input (None means the API returned null)
+_ABSENT = object()
+
 
 def validate_metrics(metrics: Dict, service: str) -> Tuple[int, List[str], List[str]]:
     """
@@ -58,7 +66,7 @@ def validate_metrics(metrics: Dict, service: str) -> Tuple[int, List[str], List[
     Returns:
         (completeness_score, missing_metrics, warnings)
     """
-    expected = SERVICE_METRICS.get(service, [])
+    expected = SERVICE_METRICS.get(service)
     if not expected:
         return 0, [f"Unknown service: {service}"], []
 
@@ -66,11 +74,12 @@ def validate_metrics(metrics: Dict, service: str) -> Tuple[int, List[str], List[
     warnings = []
 
     for metric in expected:
-        if metric not in metrics:
+        value = metrics.get(metric, _ABSENT)
+        if value is _ABSENT:
             missing.append(f"MISSING: {metric}")
-        elif metrics[metric] is None:
+        elif value is None:
             missing.append(f"NULL: {metric} (API returned null)")
-        elif metrics[metric] == 0:
+        elif value == 0:
             # Zero might be legitimate, but flag it
             warnings.append(f"ZERO: {metric} = 0 (verify this is correct)")
 
@@ -116,23 +125,8 @@ def validate_date_range(data: Dict) -> List[str]:
     return issues
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: validate_data.py <metrics.json>", file=sys.stderr)
-        sys.exit(1)
-
-    metrics_file = sys.argv[1]
-
-    try:
-        with open(metrics_file) as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"ERROR: File not found: {metrics_file}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON: {e}", file=sys.stderr)
-        sys.exit(1)
-
+def build_report(data: Dict, metrics_file: str) -> Dict:
+    """Validate one loaded metrics file and build its report."""
     service = data.get("service", "unknown")
     metrics = data.get("metrics", {})
 
@@ -142,8 +136,7 @@ def main():
     # Validate date range
     date_issues = validate_date_range(data)
 
-    # Build report
-    report = {
+    return {
         "file": metrics_file,
         "service": service,
         "project_id": data.get("project_id", "unknown"),
@@ -158,14 +151,59 @@ def main():
             "date_range_issues": date_issues,
         },
         "passed": score == 100 and len(date_issues) == 0,
-        "validation_time": datetime.utcnow().isoformat() + "Z",
+        "validation_time": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
     }
 
+
+def process_file(path: str) -> Dict:
+    """Load and validate one metrics file."""
+    return build_report(load_json(path), path)
+
+
+def process_batch(paths: List[str]) -> List[Dict]:
+    """Load and validate many metrics files, one report per file."""
+    return [build_report(data, path) for path, data in zip(paths, load_files(paths))]
+
+
+def main():
+    args = sys.argv[1:]
+
+    if len(args) >= 2 and args[0] == "--batch":
+        batch = True
+    elif len(args) == 1 and args[0] != "--batch":
+        batch = False
+    else:
+        print(
+            "Usage: validate_data.py <metrics.json>\n"
+            "       validate_data.py --batch <metrics.json|glob>...",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    try:
+        if batch:
+            reports = process_batch(expand_paths(args[1:]))
+            passed = all(report["passed"] for report in reports)
+            output = reports
+        else:
+            report = process_file(args[0])
+            passed = report["passed"]
+            output = report
+    except FileNotFoundError as e:
+        print(f"ERROR: File not found: {e.filename}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Invalid JSON: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
     # Output report
-    print(json.dumps(report, indent=2))
+    dump_json(output)
 
-    # Exit code
-    if report["passed"]:
+    # Exit code: in batch mode, 0 only if every file passed
+    if passed:
         sys.exit(0)
     else:
         sys.exit(1)